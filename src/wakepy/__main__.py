@@ -19,6 +19,7 @@ import time
 import typing
 from collections.abc import Callable, Iterator
 from dataclasses import dataclass
+from functools import lru_cache
 from itertools import cycle
 from textwrap import dedent, fill, wrap
 
@@ -397,6 +398,13 @@ def get_system_info() -> SystemInfo:
 
 
 def parse_args(args: list[str]) -> Namespace:
+    return _create_parser().parse_args(args)
+
+
+@lru_cache(maxsize=None)
+def _create_parser() -> argparse.ArgumentParser:
+    """Create the wakepy argument parser. The parser is created only once, as
+    parsing does not modify it."""
     parser = argparse.ArgumentParser(
         prog="wakepy",
         formatter_class=_create_help_formatter,
@@ -438,7 +446,7 @@ def parse_args(args: list[str]) -> Namespace:
         ),
     )
 
-    return parser.parse_args(args)
+    return parser
 
 
 def _add_mode_arguments(parser: argparse.ArgumentParser) -> None:
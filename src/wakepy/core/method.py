@@ -122,6 +122,15 @@ class Method(ABC):
     if the Method should not be listed anywhere (e.g. when Method is meant to
     be subclassed)."""
 
+    uses_dbus: bool = False
+    """Tells if the Method uses D-Bus (:meth:`process_dbus_call`). The
+    :class:`Mode` creates a :class:`~wakepy.core.DBusAdapter` only if at least
+    one of the Methods it tries to activate sets this to ``True``. Otherwise,
+    the Method instances get ``dbus_adapter=None``.
+
+    .. versionadded:: 2.0.0
+    """
+
     # waits for https://github.com/wakepy/wakepy/issues/256
     # method_kwargs: Dict[str, object] # noqa: ERA001
     """The method arguments. This is created from two parts
@@ -140,6 +149,10 @@ class Method(ABC):
         # only on methods using D-Bus.
         self.dbus_adapter = cast("DBusAdapter | None", kwargs.pop("dbus_adapter", None))
 
+        # The MethodInfo of this Method instance. Set by activate_method() so
+        # it may be reused (instead of re-created) after activation.
+        self._wakepy_method_info: Optional[MethodInfo] = None
+
         # waits for https://github.com/wakepy/wakepy/issues/256
         # self.method_kwargs = kwargs # noqa: ERA001
         self._check_supported_platforms()
@@ -292,7 +305,8 @@ class Method(ABC):
         if self.dbus_adapter is None:
             raise RuntimeError(
                 f'{self.__class__.__name__} cannot process dbus method call "{call}" '
-                "as it does not have a DBusAdapter."
+                "as it does not have a DBusAdapter. Methods which use D-Bus must "
+                "set uses_dbus = True on the Method subclass."
             )
         try:
             return self.dbus_adapter.process(call)
@@ -371,6 +385,7 @@ def activate_method(method: Method) -> Tuple[MethodActivationResult, Heartbeat |
         raise ValueError("Methods without a name may not be used to activate modes!")
 
     method_info = MethodInfo._from_method(method)
+    method._wakepy_method_info = method_info
     result = MethodActivationResult(method=method_info, success=False)
 
     logger.debug(
@@ -18,6 +18,7 @@ import warnings
 from contextvars import ContextVar
 from dataclasses import dataclass, field
 from functools import wraps
+from itertools import islice
 
 from wakepy.core.constants import WAKEPY_FAKE_SUCCESS_METHOD, StageName
 from wakepy.core.platform import CURRENT_PLATFORM, get_platform_supported
@@ -141,7 +142,7 @@ class NoCurrentModeError(RuntimeError):
 
 @dataclass(frozen=True)
 class _ModeParams:
-    method_classes: list[Type[Method]] = field(default_factory=list)
+    method_classes: Tuple[Type[Method], ...] = field(default_factory=tuple)
     name: ModeName | str = "__unnamed__"
     methods_priority: Optional[MethodsPriorityOrder] = None
     use_only: Optional[StrCollection] = None
@@ -168,7 +169,7 @@ def create_mode_params(
     )
     return _ModeParams(
         name=mode_name,
-        method_classes=methods_for_mode,
+        method_classes=tuple(methods_for_mode),
         methods_priority=methods_priority,
         on_fail=on_fail,
         dbus_adapter=dbus_adapter,
@@ -197,8 +198,6 @@ def get_selected_methods(
             missing_method_names=e.missing_method_names,
         ) from e
 
-    selected_methods = select_methods(methods_for_mode, use_only=methods, omit=omit)
-
     logger.debug(
         'Selected %d method(s) for mode "%s": %s',
         len(selected_methods),
@@ -215,6 +214,26 @@ def get_selected_methods(
     return selected_methods
 
 
+_CLASS_METHOD_INFO_ATTR = "_wakepy_class_method_info"
+
+
+def _method_info_for(method_cls: MethodCls) -> MethodInfo:
+    """Returns the MethodInfo of a Method class. The MethodInfo is immutable
+    and only depends on class attributes, so it is created once and stored on
+    the class itself (and not in a cache, which would keep the class alive).
+    The class __dict__ is used instead of getattr, so that a subclass never
+    gets the MethodInfo of its parent class."""
+    info: Optional[MethodInfo] = method_cls.__dict__.get(_CLASS_METHOD_INFO_ATTR)
+    if info is None:
+        info = MethodInfo(
+            name=method_cls.name,
+            mode_name=str(method_cls.mode_name),
+            supported_platforms=method_cls.supported_platforms,
+        )
+        setattr(method_cls, _CLASS_METHOD_INFO_ATTR, info)
+    return info
+
+
 # Storage for the currently active (innermost) Mode for the current thread and
 # context.
 _current_mode: ContextVar[Mode] = ContextVar("wakepy._current_mode")
@@ -402,6 +421,31 @@ class Mode:
     :ref:`user-guide-page`.
     """
 
+    __slots__ = (
+        "_init_params",
+        "active",
+        "result",
+        "name",
+        "_method",
+        "method",
+        "_active_method",
+        "active_method",
+        "heartbeat",
+        "_dbus_adapter_cls",
+        "_dbus_adapter_instance",
+        "_dbus_adapter_created",
+        "_all_method_classes",
+        "_selected_method_classes",
+        "on_fail",
+        "methods_priority",
+        "_lock",
+        "_context_token",
+        "_has_entered_context",
+        "_warned_activation_result",
+        "_warned_used_method",
+        "__weakref__",
+    )
+
     name: str | None
     """The name of the mode. Examples: "keep.running" for the
     :func:`keep.running <wakepy.keep.running>` mode and "keep.presenting"
@@ -534,6 +578,10 @@ class Mode:
         from `active`, because you might be entered into a mode which fails,
         so `active` can be False even if this is True. """
 
+        # The deprecation warnings are issued only once per Mode instance.
+        self._warned_activation_result: bool = False
+        self._warned_used_method: bool = False
+
     def __call__(self, func: Callable[P, R]) -> Callable[P, R]:
         """Provides the decorator syntax for the KeepAwake instances."""
 
@@ -687,7 +735,7 @@ class Mode:
                 return self.result
             self._enter()
 
-        if not self.active:
+        if not self.active and self.on_fail != "pass":
             handle_activation_fail(self.on_fail, self.result)
 
         return self.result
@@ -723,7 +771,8 @@ class Mode:
                 self.name,
                 self.active_method,
             )
-        else:
+        elif logger.isEnabledFor(logging.INFO):
+            # Building the failure text is not free; skip it if not logged.
             logger.info(self.result.get_failure_text(style="inline"))
 
     def _activate(self, methods: List[Type[Method]]) -> List[MethodActivationResult]:
@@ -732,16 +781,14 @@ class Mode:
         Returns the list of :class:`MethodActivationResult` for all tried
         (and untried) methods. Does not include unsupported methods.
         """
-        method_kwargs = self._get_method_kwargs()
+        method_kwargs = self._get_method_kwargs(methods)
         methodresults, self._active_method, self.heartbeat = (
             self._activate_first_successful_method(
                 method_classes=methods, **method_kwargs
             )
         )
         self.active_method = (
-            MethodInfo._from_method(self._active_method)
-            if self._active_method
-            else None
+            self._active_method._wakepy_method_info if self._active_method else None
         )
         self.active = self._active_method is not None
         self._method = self._active_method
@@ -808,7 +855,7 @@ class Mode:
         """
         possibly_supported, unsupported = self._get_supported_and_unsupported_methods()
 
-        method_kwargs = self._get_method_kwargs()
+        method_kwargs = self._get_method_kwargs(possibly_supported)
         results = self._try_to_activate_each(possibly_supported, **method_kwargs)
 
         platform_unsupported_results = self._create_unsupported_results(
@@ -868,11 +915,7 @@ class Mode:
     ) -> List[MethodActivationResult]:
         results: List[MethodActivationResult] = []
         for methodcls in unsupported_method_classes:
-            method_info = MethodInfo(
-                name=methodcls.name,
-                mode_name=str(methodcls.mode_name),
-                supported_platforms=methodcls.supported_platforms,
-            )
+            method_info = _method_info_for(methodcls)
             supported_platforms = ", ".join(methodcls.supported_platforms)
             results.append(
                 MethodActivationResult(
@@ -913,13 +956,10 @@ class Mode:
                 break
 
         # Unused methods
-        for cls in method_classes[tried:]:
-            methodinfo = MethodInfo(
-                name=cls.name,
-                mode_name=str(cls.mode_name),
-                supported_platforms=cls.supported_platforms,
+        for cls in islice(method_classes, tried, None):
+            results.append(
+                MethodActivationResult(method=_method_info_for(cls), success=None)
             )
-            results.append(MethodActivationResult(method=methodinfo, success=None))
 
         return results, active_method, heartbeat
 
@@ -977,36 +1017,43 @@ class Mode:
             self._dbus_adapter_created = True
         return self._dbus_adapter_instance
 
-    def _get_method_kwargs(self) -> dict[str, object]:
-        method_kwargs: dict[str, object] = {"dbus_adapter": self._dbus_adapter}
+    def _get_method_kwargs(self, methods: List[Type[Method]]) -> dict[str, object]:
+        # The DBusAdapter is only created if some of the methods need it.
+        uses_dbus = any(m.uses_dbus for m in methods)
+        dbus_adapter = self._dbus_adapter if uses_dbus else None
+        method_kwargs: dict[str, object] = {"dbus_adapter": dbus_adapter}
         return method_kwargs
 
     @property
-    def activation_result(self) -> ActivationResult:  # pragma: no cover
+    def activation_result(self) -> ActivationResult:
         """
         .. deprecated:: 1.0.0
             Use :attr:`result` instead. This property will be removed in a
             future version of wakepy."""
-        warnings.warn(
-            "'Mode.activation_result' is deprecated in wakepy 1.0.0 and will be "
-            "removed in a future version. Use 'Mode.result', instead.",
-            DeprecationWarning,
-            stacklevel=2,
-        )
+        if not self._warned_activation_result:
+            warnings.warn(
+                "'Mode.activation_result' is deprecated in wakepy 1.0.0 and will be "
+                "removed in a future version. Use 'Mode.result', instead.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            self._warned_activation_result = True
         return self.result
 
     @property
-    def used_method(self) -> str | None:  # pragma: no cover
+    def used_method(self) -> str | None:
         """
         .. deprecated:: 1.0.0
             Use :attr:`method` instead. This property will be removed in a
             future version of wakepy."""
-        warnings.warn(
-            "'Mode.used_method' is deprecated in wakepy 1.0.0 and will be "
-            "removed in a future version. Use 'Mode.method', instead.",
-            DeprecationWarning,
-            stacklevel=2,
-        )
+        if not self._warned_used_method:
+            warnings.warn(
+                "'Mode.used_method' is deprecated in wakepy 1.0.0 and will be "
+                "removed in a future version. Use 'Mode.method', instead.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            self._warned_used_method = True
         return self.method.name if self.method else None
 
 
@@ -1064,11 +1111,19 @@ def select_methods(
     elif omit is None and use_only is None:
         selected_methods = list(methods)
     elif omit is not None:
-        selected_methods = [m for m in methods if m.name not in omit]
+        omit_names = frozenset(omit)
+        selected_methods = [m for m in methods if m.name not in omit_names]
     elif use_only is not None:
-        selected_methods = [m for m in methods if m.name in use_only]
-        if not set(use_only).issubset(m.name for m in selected_methods):
-            missing = sorted(set(use_only) - set(m.name for m in selected_methods))
+        use_only_names = frozenset(use_only)
+        selected_methods = []
+        selected_names = set()
+        for m in methods:
+            if m.name in use_only_names:
+                selected_methods.append(m)
+                selected_names.add(m.name)
+        missing_names = use_only_names - selected_names
+        if missing_names:
+            missing = sorted(missing_names)
             raise UnrecognizedMethodNames(
                 f"Methods {missing} in `use_only` are not part of `methods`!",
                 missing_method_names=missing,
@@ -1080,18 +1135,34 @@ def select_methods(
 
 
 def handle_activation_fail(on_fail: OnFail, result: ActivationResult) -> None:
-    if on_fail == "pass":
-        return
-    elif on_fail == "warn":
-        warnings.warn(
-            result.get_failure_text(style="block"), ActivationWarning, stacklevel=5
-        )
-        return
-    elif on_fail == "error":
-        raise ActivationError(result.get_failure_text(style="block"))
-    elif not callable(on_fail):
+    handler = _ON_FAIL_HANDLERS.get(on_fail) if isinstance(on_fail, str) else None
+    if handler is not None:
+        handler(result)
+    elif callable(on_fail):
+        on_fail(result)
+    else:
         raise ValueError(
             'on_fail must be one of "error", "warn", pass" or a callable which takes '
             "single positional argument (ActivationResult)"
         )
-    on_fail(result)
+
+
+def _pass_activation_fail(result: ActivationResult) -> None:
+    return
+
+
+def _warn_activation_fail(result: ActivationResult) -> None:
+    warnings.warn(
+        result.get_failure_text(style="block"), ActivationWarning, stacklevel=5
+    )
+
+
+def _raise_activation_fail(result: ActivationResult) -> None:
+    raise ActivationError(result.get_failure_text(style="block"))
+
+
+_ON_FAIL_HANDLERS: dict[str, Callable[[ActivationResult], None]] = {
+    "pass": _pass_activation_fail,
+    "warn": _warn_activation_fail,
+    "error": _raise_activation_fail,
+}
@@ -31,14 +31,16 @@ def is_env_var_truthy(env_var_name: str) -> bool:
     WAKEPY_FAKE_SUCCESS and WAKEPY_FORCE_FAILURE.
     """
     env_var_value = os.environ.get(env_var_name)
-
-    if env_var_value is None:
-        logger.debug("'%s' is not set.", env_var_name)
-        return False
-
-    if env_var_value.lower() in FALSY_ENV_VAR_VALUES:
-        logger.debug("'%s' has a falsy value: %s.", env_var_name, env_var_value)
-        return False
-
-    logger.debug("'%s' has a truthy value: %s.", env_var_name, env_var_value)
-    return True
+    # Most values are already lower-case; check those without calling lower()
+    is_truthy = (
+        env_var_value is not None
+        and env_var_value not in FALSY_ENV_VAR_VALUES
+        and env_var_value.lower() not in FALSY_ENV_VAR_VALUES
+    )
+    logger.debug(
+        "'%s' is %s (value: %r).",
+        env_var_name,
+        "truthy" if is_truthy else "falsy",
+        env_var_value,
+    )
+    return is_truthy
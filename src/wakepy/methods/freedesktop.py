@@ -45,6 +45,7 @@ class FreedesktopInhibitorWithCookieMethod(Method):
 
     service_dbus_address: DBusAddress
     supported_platforms = (PlatformType.UNIX_LIKE_FOSS,)
+    uses_dbus = True
 
     def __init__(self, **kwargs: object) -> None:
         super().__init__(**kwargs)
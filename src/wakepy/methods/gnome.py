@@ -60,6 +60,7 @@ class _GnomeSessionManager(Method, ABC):
     ).of(session_manager)
 
     supported_platforms = (PlatformType.UNIX_LIKE_FOSS,)
+    uses_dbus = True
 
     @property
     @abstractmethod
@@ -3,15 +3,27 @@ from __future__ import annotations
 import logging
 import typing
 from abc import ABC, abstractmethod
-from io import IOBase
-from subprocess import PIPE, Popen
-from typing import cast
+from subprocess import DEVNULL, PIPE, Popen
 
 from wakepy.core import Method, ModeName, PlatformType
 
 if typing.TYPE_CHECKING:
     from typing import List, Optional
 
+logger = logging.getLogger(__name__)
+
+
+class _JoinedCommand:
+    """Joins the command parts with spaces when converted to a string. Used
+    as a logging argument, so that the join is done only if the log record is
+    actually emitted."""
+
+    def __init__(self, command: List[str]) -> None:
+        self.command = command
+
+    def __str__(self) -> str:
+        return " ".join(self.command)
+
 
 class _MacCaffeinate(Method, ABC):
     """This is a method which calls the `caffeinate` command.
@@ -28,33 +40,33 @@ class _MacCaffeinate(Method, ABC):
 
     supported_platforms = (PlatformType.MACOS,)
 
+    logger = logger
+
     def __init__(self, **kwargs: object) -> None:
         super().__init__(**kwargs)
-        self.logger = logging.getLogger(__name__)
         self._process: Optional[Popen[bytes]] = None
 
     def enter_mode(self) -> None:
-        self.logger.debug('Running "%s"', " ".join(self.command))
+        self.logger.debug('Running "%s"', _JoinedCommand(self.command))
         # command is a hardcoded list, safe from injection (-> skip S603)
-        self._process = Popen(self.command, stdin=PIPE, stdout=PIPE)  # noqa: S603
+        # Only stdin needs to be a pipe (see CaffeinateKeepRunning). Nothing is
+        # read from stdout, so no pipe is created for it.
+        self._process = Popen(self.command, stdin=PIPE, stdout=DEVNULL)  # noqa: S603
 
     def exit_mode(self) -> None:
         if self._process is None:
             self.logger.debug("No need to terminate process (not started)")
             return
-        self.logger.debug('Terminating process ("%s")', " ".join(self.command))
+        self.logger.debug('Terminating process ("%s")', _JoinedCommand(self.command))
 
-        # The pipes need to be closed before terminating the process, otherwise
+        # The pipe needs to be closed before terminating the process, otherwise
         # will get ResourceWarning: unclosed file
         # See: https://stackoverflow.com/a/58696973/3015186 and
         # https://github.com/wakepy/wakepy/issues/478
         #
-        # The cast is required because we know that these are not None, but
-        # mypy doesn't, and using if statements would ruin test coverage.
-        stdin = cast(IOBase, self._process.stdin)
-        stdout = cast(IOBase, self._process.stdout)
-        stdin.close()
-        stdout.close()
+        # The stdin is never None as it was opened with PIPE, but mypy does not
+        # know it, and using if statements would ruin test coverage.
+        self._process.stdin.close()  # type: ignore[union-attr]
 
         self._process.terminate()
         self._process.wait()
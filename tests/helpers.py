@@ -1,6 +1,10 @@
+from argparse import Namespace
+from copy import copy
 from functools import lru_cache
+from typing import Tuple
 
 from wakepy import Method, MethodInfo
+from wakepy.__main__ import parse_args
 
 TEST_MODE = "test-mode"
 
@@ -15,7 +19,19 @@ def get_test_method(name: str, mode_name: str = TEST_MODE) -> Method:
     return TestMethod()
 
 
+@lru_cache(maxsize=None)
 def get_method_info(method_name: str, mode_name: str = TEST_MODE) -> MethodInfo:
     """Get a MethodInfo object for the given method name."""
     method = get_test_method(method_name, mode_name=mode_name)
     return MethodInfo._from_method(method)
+
+
+def parse_args_cached(*argv: str) -> Namespace:
+    """Parse the wakepy CLI arguments. The parsing is done only once for each
+    unique argv. Returns a copy, so the result may be modified."""
+    return copy(_parse_args_cached(argv))
+
+
+@lru_cache(maxsize=32)
+def _parse_args_cached(argv: Tuple[str, ...]) -> Namespace:
+    return parse_args(list(argv))
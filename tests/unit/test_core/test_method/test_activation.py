@@ -126,6 +126,8 @@ class TestActivateMethod:
         assert res.failure_reason == ""
         # No heartbeat on success, as the used Method does not have heartbeat()
         assert heartbeat is None
+        # The MethodInfo is stored on the Method for reuse
+        assert method._wakepy_method_info is res.method
 
     def test_heartbeat_success(self):
         method = get_test_method_class(heartbeat=None)()
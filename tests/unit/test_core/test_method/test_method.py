@@ -142,8 +142,9 @@ class TestProcessDBusCall:
         with pytest.raises(
             RuntimeError,
             match=".*cannot process dbus method call.*as it does not have a DBusAdapter",  # noqa: E501
-        ):
+        ) as exc_info:
             assert method.process_dbus_call(DBusMethodCall(dbus_method))
+        assert "set uses_dbus = True on the Method subclass" in str(exc_info.value)
 
     def test_error_when_calling_dbus_methods(self, dbus_method: DBusMethod):
         method = Method()
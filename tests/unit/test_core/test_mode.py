@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import asyncio
-import copy
-import queue
+import logging
 import re
 import threading
 import typing
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from unittest.mock import Mock
 
 import pytest
@@ -32,77 +33,109 @@ from wakepy.core.heartbeat import Heartbeat
 from wakepy.core.mode import (
     ModeExit,
     UnrecognizedMethodNames,
+    _method_info_for,
     _ModeParams,
     handle_activation_fail,
     select_methods,
 )
-from wakepy.core.registry import get_methods
+from wakepy.core.registry import get_methods, register_method
 
 if typing.TYPE_CHECKING:
-    from typing import List, Type
+    from typing import List, Tuple, Type
 
+UNRECOGNIZED_METHODS_MATCH = re.compile(
+    re.escape("Methods ['bar', 'foo'] in `use_only` are not part of `methods`!")
+)
+OMIT_AND_USE_ONLY_MATCH = re.compile(
+    re.escape("Can only define omit (blacklist) or use_only (whitelist), not both!")
+)
+ON_FAIL_VALUE_MATCH = re.compile("on_fail must be one of")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def dbus_adapter_cls():
     class TestDbusAdapter(DBusAdapter): ...
 
     return TestDbusAdapter
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def testmode_cls():
     class TestMode(Mode): ...
 
     return TestMode
 
 
-@pytest.fixture
-def methods_abc(monkeypatch, testutils) -> List[Type[Method]]:
-    """This fixture creates three methods, which belong to a given mode."""
-    testutils.empty_method_registry(monkeypatch)
+@pytest.fixture(scope="module")
+def methods_abc_classes(testutils) -> Tuple[Type[Method], ...]:
+    """Creates the three Method classes of the `methods_abc` fixture once per
+    module. The registry is emptied only while creating the classes."""
+    with pytest.MonkeyPatch.context() as mp:
+        testutils.empty_method_registry(mp)
 
-    class TestMethod(Method):
-        supported_platforms = (PlatformType.ANY,)
+        class TestMethod(Method):
+            supported_platforms = (PlatformType.ANY,)
 
-    class MethodA(TestMethod):
-        name = "MethodA"
-        mode_name = "foo"
+        class MethodA(TestMethod):
+            name = "MethodA"
+            mode_name = "foo"
 
-        def enter_mode(self): ...
+            def enter_mode(self): ...
 
-    class MethodB(TestMethod):
-        name = "MethodB"
-        mode_name = "foo"
+        class MethodB(TestMethod):
+            name = "MethodB"
+            mode_name = "foo"
 
-        def enter_mode(self): ...
+            def enter_mode(self): ...
 
-    class MethodC(TestMethod):
-        name = "MethodC"
-        mode_name = "foo"
+        class MethodC(TestMethod):
+            name = "MethodC"
+            mode_name = "foo"
 
-        def enter_mode(self): ...
+            def enter_mode(self): ...
 
-    return [MethodA, MethodB, MethodC]
+    return (MethodA, MethodB, MethodC)
 
 
 @pytest.fixture
-def methods_priority0():
-    return ["*"]
+def methods_abc(
+    monkeypatch, testutils, methods_abc_classes: Tuple[Type[Method], ...]
+) -> List[Type[Method]]:
+    """Three methods, which belong to a given mode. These are the only methods
+    in the registry (in addition to WakepyFakeSuccess)."""
+    testutils.empty_method_registry(monkeypatch)
+    for method_cls in methods_abc_classes:
+        register_method(method_cls)
+    return list(methods_abc_classes)
+
+
+@pytest.fixture(scope="session")
+def methods_priority0() -> Tuple[str, ...]:
+    return ("*",)
+
+
+@pytest.fixture(scope="module")
+def base_params(
+    methods_abc_classes: Tuple[Type[Method], ...],
+    methods_priority0: Tuple[str, ...],
+) -> _ModeParams:
+    """The Mode parameters shared by the Mode fixtures. As _ModeParams is
+    frozen, variants are created with dataclasses.replace()."""
+    return _ModeParams(
+        name="TestMode",
+        method_classes=methods_abc_classes,
+        dbus_adapter=None,
+        methods_priority=methods_priority0,
+    )
 
 
 @pytest.fixture
 def mode0(
     methods_abc: List[Type[Method]],
     testmode_cls: Type[Mode],
-    methods_priority0: List[str],
+    base_params: _ModeParams,
 ) -> typing.Generator[Mode, None, None]:
-    params = _ModeParams(
-        name="TestMode",
-        method_classes=methods_abc,
-        dbus_adapter=None,
-        methods_priority=methods_priority0,
-    )
-    mode = testmode_cls(params)
+    mode = testmode_cls(base_params)
     yield mode
     mode.exit()  # safe no-op if never entered
 
@@ -111,15 +144,10 @@ def mode0(
 def mode1_with_dbus(
     methods_abc: List[Type[Method]],
     testmode_cls: Type[Mode],
-    methods_priority0: List[str],
+    base_params: _ModeParams,
     dbus_adapter_cls: Type[DBusAdapter],
 ):
-    params = _ModeParams(
-        name="TestMode1",
-        method_classes=methods_abc,
-        methods_priority=methods_priority0,
-        dbus_adapter=dbus_adapter_cls,
-    )
+    params = replace(base_params, name="TestMode1", dbus_adapter=dbus_adapter_cls)
     return testmode_cls(params)
 
 
@@ -180,7 +208,7 @@ class TestProbeAllMethods:
 
         params = _ModeParams(
             name="foo",
-            method_classes=[method_a, method_b, method_c, method_d],
+            method_classes=(method_a, method_b, method_c, method_d),
             methods_priority=["*"],
         )
         result = Mode(params).probe_all_methods()
@@ -221,7 +249,7 @@ class TestModeContextManager:
             # The active method is also available
             assert isinstance(mode0._active_method, Method)
 
-            activation_result = copy.deepcopy(m.result)
+            activation_result = m.result
             flag_end_of_with_block = True
 
         # reached the end of the with block
@@ -233,15 +261,19 @@ class TestModeContextManager:
         assert m.active_method is None
         # The activation result is still there (not removed during
         # deactivation)
-        assert activation_result == m.result
+        assert m.result is activation_result
 
     def test_active_is_none_before_activation(self, mode0: Mode):
         """Mode.active is None before entering the context manager"""
         assert mode0.active is None
 
+    def test_mode_uses_slots(self):
+        mode = Mode(_ModeParams(method_classes=()))
+        assert not hasattr(mode, "__dict__")
+
     def test_active_is_false_on_failed_activation(self):
         """Mode.active is False when activation is attempted but fails"""
-        params = _ModeParams(method_classes=[], on_fail="pass")
+        params = _ModeParams(method_classes=(), on_fail="pass")
         mode = Mode(params)
 
         assert mode.active is None
@@ -251,13 +283,22 @@ class TestModeContextManager:
 
         assert m.active is None
 
+    def test_failure_text_is_logged_on_info_level(self, caplog):
+        params = _ModeParams(method_classes=(), name="testmode", on_fail="pass")
+
+        with caplog.at_level(logging.INFO, logger="wakepy.core.mode"):
+            with Mode(params):
+                ...
+
+        assert 'Could not activate wakepy Mode "testmode"!' in caplog.text
+
     @pytest.mark.usefixtures("WAKEPY_FAKE_SUCCESS_eq_1")
     def test_no_methods_succeeds_when_using_fake_success(
         self,
     ):
         # This will not fail as when the Mode is activated, the
         # WakepyFakeSuccess method is added to the list of used methods.
-        params = _ModeParams(method_classes=[])
+        params = _ModeParams(method_classes=())
         with Mode(params):
             ...
 
@@ -265,7 +306,7 @@ class TestModeContextManager:
         """Test the .active_method and .method attributes"""
 
         [MethodA, MethodB, _] = methods_abc
-        params = _ModeParams(method_classes=[MethodA, MethodB])
+        params = _ModeParams(method_classes=(MethodA, MethodB))
         mode = Mode(params)
 
         method_info_a = MethodInfo._from_method(MethodA())
@@ -277,7 +318,7 @@ class TestModeContextManager:
         with mode:
             # When mode is active, active and used methods are same.
             assert mode.active_method == method_info_a
-            assert mode.method == method_info_a
+            assert mode.method is mode.active_method
 
         # when mode is not active, active method is None, but used method is
         # the one used previously.
@@ -573,7 +614,7 @@ class TestModeEnterExit:
         assert mode0.active is None
 
     def test_enter_on_fail_error_succeeds(self):
-        params = _ModeParams(method_classes=[], on_fail="error")
+        params = _ModeParams(method_classes=(), on_fail="error")
         mode = Mode(params)
 
         with pytest.raises(ActivationError):
@@ -584,7 +625,7 @@ class TestModeEnterExit:
         mode.exit()
 
     def test_enter_on_fail_warn_succeeds(self):
-        params = _ModeParams(method_classes=[], on_fail="warn")
+        params = _ModeParams(method_classes=(), on_fail="warn")
         mode = Mode(params)
 
         with pytest.warns(ActivationWarning):
@@ -643,12 +684,12 @@ class TestHandleActivationFail:
     """Tests for handle_activation_fail"""
 
     @staticmethod
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def result1():
         return ActivationResult([], mode_name="testmode")
 
     @staticmethod
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def error_text_match(result1):
         return re.escape(result1.get_failure_text())
 
@@ -673,7 +714,7 @@ class TestHandleActivationFail:
         mock.assert_called_once_with(result1)
 
     def test_bad_on_fail_value(self, result1):
-        with pytest.raises(ValueError, match="on_fail must be one of"):
+        with pytest.raises(ValueError, match=ON_FAIL_VALUE_MATCH):
             handle_activation_fail(
                 on_fail="foo",  # type: ignore
                 result=result1,
@@ -708,9 +749,7 @@ class TestSelectMethods:
         # If a whitelist contains extra methods, raise exception
         with pytest.raises(
             UnrecognizedMethodNames,
-            match=re.escape(
-                "Methods ['bar', 'foo'] in `use_only` are not part of `methods`!"
-            ),
+            match=UNRECOGNIZED_METHODS_MATCH,
         ):
             select_methods(methods, use_only=["foo", "bar"])
 
@@ -720,13 +759,31 @@ class TestSelectMethods:
         # Cannot provide both: omit and use_only
         with pytest.raises(
             ValueError,
-            match=re.escape(
-                "Can only define omit (blacklist) or use_only (whitelist), not both!"
-            ),
+            match=OMIT_AND_USE_ONLY_MATCH,
         ):
             select_methods(methods, use_only=["B"], omit=["E"])
 
 
+@pytest.fixture(scope="module")
+def enter_mode_error() -> Exception:
+    return Exception("error")
+
+
+@pytest.fixture(scope="module")
+def methodcls_success() -> Type[Method]:
+    return get_test_method_class(enter_mode=None)
+
+
+@pytest.fixture(scope="module")
+def methodcls_fail(enter_mode_error: Exception) -> Type[Method]:
+    return get_test_method_class(enter_mode=enter_mode_error)
+
+
+@pytest.fixture(scope="module")
+def methodcls_success_with_hb() -> Type[Method]:
+    return get_test_method_class(enter_mode=None, heartbeat=None)
+
+
 class TestActivateFirstSuccessfulMethod:
     def test_no_methods(self):
         # Act
@@ -739,11 +796,7 @@ class TestActivateFirstSuccessfulMethod:
         assert active_method is None
         assert heartbeat is None
 
-    def test_success(self):
-        # Setup
-        methodcls_fail = get_test_method_class(enter_mode=Exception("error"))
-        methodcls_success = get_test_method_class(enter_mode=None)
-
+    def test_success(self, methodcls_success, methodcls_fail):
         # Act
         res, active_method, heartbeat = Mode._activate_first_successful_method(
             [methodcls_success, methodcls_fail],
@@ -763,12 +816,7 @@ class TestActivateFirstSuccessfulMethod:
         assert isinstance(active_method, methodcls_success)
         assert heartbeat is None
 
-    def test_success_with_heartbeat(self):
-        # Setup
-        methodcls_success_with_hb = get_test_method_class(
-            enter_mode=None, heartbeat=None
-        )
-
+    def test_success_with_heartbeat(self, methodcls_success_with_hb):
         # Act
         res, active_method, heartbeat = Mode._activate_first_successful_method(
             [methodcls_success_with_hb],
@@ -786,11 +834,7 @@ class TestActivateFirstSuccessfulMethod:
         assert isinstance(active_method, methodcls_success_with_hb)
         assert isinstance(heartbeat, Heartbeat)
 
-    def test_failure(self):
-        # Setup
-        exc = Exception("error")
-        methodcls_fail = get_test_method_class(enter_mode=exc)
-
+    def test_failure(self, methodcls_fail, enter_mode_error):
         # Act
         res, active_method, heartbeat = Mode._activate_first_successful_method(
             [methodcls_fail]
@@ -803,13 +847,124 @@ class TestActivateFirstSuccessfulMethod:
                 method=MethodInfo._from_method(methodcls_fail()),
                 success=False,
                 failure_stage=StageName.ACTIVATION,
-                failure_reason=repr(exc),
+                failure_reason=repr(enter_mode_error),
             )
         ]
         assert active_method is None
         assert heartbeat is None
         assert heartbeat is None
 
+    def test_unused_methods_share_method_info(self, methodcls_success, methodcls_fail):
+        res, _, _ = Mode._activate_first_successful_method(
+            [methodcls_success, methodcls_fail],
+        )
+
+        expected_fail_info = MethodInfo._from_method(methodcls_fail())
+        assert res[1].method is _method_info_for(methodcls_fail)
+        assert res[1].method == expected_fail_info
+
+    def test_method_info_is_not_inherited(self, methodcls_success):
+        SubMethod = type(
+            "SubMethod", (methodcls_success,), {"name": "SubMethodOfSuccess"}
+        )
+
+        parent_info = _method_info_for(methodcls_success)
+        sub_info = _method_info_for(SubMethod)
+
+        assert sub_info.name == "SubMethodOfSuccess"
+        assert parent_info.name == methodcls_success.name
+        assert _method_info_for(SubMethod) is sub_info
+
+
+class TestDBusAdapterCreation:
+    def test_not_created_if_methods_do_not_use_dbus(self, mode1_with_dbus: Mode):
+        methods = mode1_with_dbus._selected_method_classes
+
+        kwargs = mode1_with_dbus._get_method_kwargs(methods)
+
+        assert kwargs == {"dbus_adapter": None}
+        assert mode1_with_dbus._dbus_adapter_created is False
+
+    def test_created_once_if_a_method_uses_dbus(
+        self, mode1_with_dbus: Mode, dbus_adapter_cls: Type[DBusAdapter]
+    ):
+        class DBusUsingMethod(Method):
+            name = "DBusUsingMethod"
+            mode_name = "foo"
+            uses_dbus = True
+
+        methods: List[Type[Method]] = [
+            *mode1_with_dbus._selected_method_classes,
+            DBusUsingMethod,
+        ]
+
+        kwargs1 = mode1_with_dbus._get_method_kwargs(methods)
+        kwargs2 = mode1_with_dbus._get_method_kwargs(methods)
+
+        assert isinstance(kwargs1["dbus_adapter"], dbus_adapter_cls)
+        assert kwargs2["dbus_adapter"] is kwargs1["dbus_adapter"]
+
+    @pytest.mark.usefixtures("methods_abc")
+    def test_activated_method_gets_the_adapter(
+        self,
+        testmode_cls: Type[Mode],
+        base_params: _ModeParams,
+        dbus_adapter_cls: Type[DBusAdapter],
+    ):
+        class DBusUsingMethod(Method):
+            name = "DBusUsingMethod"
+            mode_name = "foo"
+            supported_platforms = (PlatformType.ANY,)
+            uses_dbus = True
+
+            def enter_mode(self): ...
+
+        params = replace(
+            base_params,
+            method_classes=(DBusUsingMethod,),
+            dbus_adapter=dbus_adapter_cls,
+        )
+
+        with testmode_cls(params) as mode:
+            assert isinstance(mode._active_method, DBusUsingMethod)
+            assert isinstance(mode._active_method.dbus_adapter, dbus_adapter_cls)
+            assert mode._active_method.dbus_adapter is mode._dbus_adapter
+
+
+class TestDeprecatedProperties:
+    """The deprecated properties warn only on the first access of each Mode
+    instance."""
+
+    def test_activation_result_warns_once(self, mode0: Mode):
+        with pytest.warns(DeprecationWarning, match="'Mode.activation_result'"):
+            assert mode0.activation_result is mode0.result
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert mode0.activation_result is mode0.result
+
+    def test_used_method_warns_once(self, mode0: Mode):
+        with mode0:
+            assert mode0.method is not None
+            with pytest.warns(DeprecationWarning, match="'Mode.used_method'"):
+                assert mode0.used_method == mode0.method.name
+
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                assert mode0.used_method == mode0.method.name
+
+    def test_used_method_without_method(self, mode0: Mode):
+        with pytest.warns(DeprecationWarning, match="'Mode.used_method'"):
+            assert mode0.used_method is None
+
+
+@pytest.fixture(scope="module")
+def worker() -> typing.Generator[ThreadPoolExecutor, None, None]:
+    """A single worker thread, shared by the tests which need to run something
+    in another thread."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        yield executor
+
 
 class TestModeThreadSafety:
     """Tests for thread-safe enter/exit behavior."""
@@ -873,17 +1028,14 @@ class TestModeThreadSafety:
         mode0.exit()
 
     @pytest.mark.usefixtures("WAKEPY_FAKE_SUCCESS_eq_1")
-    def test_cross_thread_exit_does_not_crash(self, mode0: Mode) -> None:
+    def test_cross_thread_exit_does_not_crash(
+        self, mode0: Mode, worker: ThreadPoolExecutor
+    ) -> None:
         """enter() on thread A, exit() on thread B: no exception."""
         mode0.enter()
         assert mode0.active is True
 
-        def deactivate_in_thread() -> None:
-            mode0.exit()
-
-        t = threading.Thread(target=deactivate_in_thread)
-        t.start()
-        t.join()
+        worker.submit(mode0.exit).result()
 
         assert mode0.active is None
 
@@ -931,21 +1083,17 @@ class TestModeThreadSafety:
         assert errors == [], f"Unexpected errors from threads: {errors}"
 
     @pytest.mark.usefixtures("WAKEPY_FAKE_SUCCESS_eq_1")
-    def test_global_modes_visible_from_other_thread(self, mode0: Mode) -> None:
+    def test_global_modes_visible_from_other_thread(
+        self, mode0: Mode, worker: ThreadPoolExecutor
+    ) -> None:
         """global_modes() from another thread returns the same result."""
 
         mode0.enter()
 
-        results: queue.Queue[bool] = queue.Queue()
-
-        def check_from_thread() -> None:
-            results.put(mode0 in global_modes())
+        def check_from_thread() -> bool:
+            return mode0 in global_modes()
 
-        t = threading.Thread(target=check_from_thread)
-        t.start()
-        t.join()
-
-        assert results.get() is True
+        assert worker.submit(check_from_thread).result() is True
         mode0.exit()
 
 
@@ -958,17 +1106,12 @@ class TestWakepyForceFailure:
         methods_abc: List[Type[Method]],
         testmode_cls: Type[Mode],
         dbus_adapter_cls: Type[DBusAdapter],
+        base_params: _ModeParams,
     ):
         """Test that WAKEPY_FORCE_FAILURE causes activation to fail"""
         monkeypatch.setenv("WAKEPY_FORCE_FAILURE", "1")
 
-        params = _ModeParams(
-            name="TestMode",
-            method_classes=methods_abc,
-            dbus_adapter=dbus_adapter_cls,
-            methods_priority=["*"],
-            on_fail="pass",
-        )
+        params = replace(base_params, dbus_adapter=dbus_adapter_cls, on_fail="pass")
         mode = testmode_cls(params)
 
         with mode as m:
@@ -984,18 +1127,13 @@ class TestWakepyForceFailure:
         methods_abc: List[Type[Method]],
         testmode_cls: Type[Mode],
         dbus_adapter_cls: Type[DBusAdapter],
+        base_params: _ModeParams,
     ):
         """Test that when both env vars set, WAKEPY_FORCE_FAILURE wins"""
         monkeypatch.setenv("WAKEPY_FAKE_SUCCESS", "1")
         monkeypatch.setenv("WAKEPY_FORCE_FAILURE", "1")
 
-        params = _ModeParams(
-            name="TestMode",
-            method_classes=methods_abc,
-            dbus_adapter=dbus_adapter_cls,
-            methods_priority=["*"],
-            on_fail="pass",
-        )
+        params = replace(base_params, dbus_adapter=dbus_adapter_cls, on_fail="pass")
         mode = testmode_cls(params)
 
         with mode as m:
@@ -1023,42 +1161,45 @@ class TestWakepyForceFailure:
             assert "WAKEPY_FORCE_FAILURE" in res.failure_reason
 
 
+EXPECTED_PLATFORM_SPLIT = {
+    IdentifiedPlatformType.WINDOWS: ({"windows", "any"}, {"linux"}),
+    IdentifiedPlatformType.LINUX: ({"linux", "any"}, {"windows"}),
+    IdentifiedPlatformType.UNKNOWN: ({"windows", "linux", "any"}, set()),
+}
+"""The expected (possibly_supported, unsupported) keys of `platform_methods`
+on each platform."""
+
+
+@pytest.fixture(scope="module")
+def platform_methods() -> dict[str, Type[Method]]:
+    return {
+        "windows": get_test_method_class(supported_platforms=(PlatformType.WINDOWS,)),
+        "linux": get_test_method_class(supported_platforms=(PlatformType.LINUX,)),
+        "any": get_test_method_class(supported_platforms=(PlatformType.ANY,)),
+    }
+
+
 class TestSplitByPlatformSupport:
     @pytest.mark.parametrize(
         "current_platform",
-        [
-            IdentifiedPlatformType.WINDOWS,
-            IdentifiedPlatformType.LINUX,
-            IdentifiedPlatformType.UNKNOWN,
-        ],
+        list(EXPECTED_PLATFORM_SPLIT),
+        ids=str,
         indirect=["current_platform"],
     )
     def test_split_by_platform_support(
         self,
         current_platform,
+        platform_methods,
     ):
-        expected_supported, expected_unsupported = {
-            IdentifiedPlatformType.WINDOWS: ({"windows", "any"}, {"linux"}),
-            IdentifiedPlatformType.LINUX: ({"linux", "any"}, {"windows"}),
-            IdentifiedPlatformType.UNKNOWN: (
-                {"windows", "linux", "any"},
-                set(),
-            ),
-        }[current_platform]
-        windows_method = get_test_method_class(
-            supported_platforms=(PlatformType.WINDOWS,)
-        )
-        linux_method = get_test_method_class(supported_platforms=(PlatformType.LINUX,))
-        any_method = get_test_method_class(supported_platforms=(PlatformType.ANY,))
-        methods = {
-            "windows": windows_method,
-            "linux": linux_method,
-            "any": any_method,
-        }
+        expected_supported, expected_unsupported = EXPECTED_PLATFORM_SPLIT[
+            current_platform
+        ]
 
         possibly_supported, unsupported = Mode._split_by_platform_support(
-            [windows_method, linux_method, any_method]
+            list(platform_methods.values())
         )
 
-        assert set(possibly_supported) == {methods[k] for k in expected_supported}
-        assert set(unsupported) == {methods[k] for k in expected_unsupported}
+        assert set(possibly_supported) == {
+            platform_methods[k] for k in expected_supported
+        }
+        assert set(unsupported) == {platform_methods[k] for k in expected_unsupported}
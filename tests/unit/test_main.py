@@ -3,109 +3,224 @@
 import argparse
 import logging
 import string
-from unittest.mock import Mock, patch
+import sys
+from contextlib import redirect_stdout
+from functools import lru_cache
+from io import StringIO
+from itertools import islice
 
 import pytest
 
-from tests.helpers import get_method_info
-from wakepy import ActivationResult, Method, ProbingResults
+import wakepy.__main__ as wakepy_main
+from tests.helpers import get_method_info, parse_args_cached
+from wakepy import ActivationResult, Method, Mode, ProbingResults
 from wakepy.__main__ import (
     UI,
     CliApp,
     DisplayTheme,
     MultipleModesSelectedError,
+    _create_parser,
     get_logging_level,
     get_mode_name,
     get_should_use_ascii_only,
     main,
-    parse_args,
     setup_logging,
 )
 from wakepy.core import PlatformType
 from wakepy.core.activationresult import MethodActivationResult
 from wakepy.core.constants import IdentifiedPlatformType, ModeName, StageName
 
+# DisplayTheme is a frozen dataclass, so the themes can be shared by the tests
+UNICODE_THEME = DisplayTheme.create(ascii_mode=False)
+ASCII_THEME = DisplayTheme.create(ascii_mode=True)
+
+LONG_NAME_BASE = string.ascii_letters + string.digits
+VERY_LONG_MODE_NAME = f"mode_{LONG_NAME_BASE}"
+VERY_LONG_METHOD_NAME = f"method_{LONG_NAME_BASE}"
+
+# (platform, python_impl, expected) for get_should_use_ascii_only
+ASCII_MODE_CASES = (
+    # Non-Windows platforms should always use Unicode
+    (IdentifiedPlatformType.LINUX, "CPython", False),
+    (IdentifiedPlatformType.LINUX, "PyPy", False),
+    (IdentifiedPlatformType.MACOS, "CPython", False),
+    (IdentifiedPlatformType.MACOS, "PyPy", False),
+    # Windows + PyPy needs ASCII mode
+    (IdentifiedPlatformType.WINDOWS, "PyPy", True),
+    (IdentifiedPlatformType.WINDOWS, "pypy", True),  # case insensitive
+    # Windows + CPython can use Unicode
+    (IdentifiedPlatformType.WINDOWS, "CPython", False),
+)
 
-@pytest.fixture(scope="session")
-def mode_name_working():
-    return "testmode_working"
+# Arguments for CliApp.run_wakepy_methods(). Not modified by the tests.
+KEEP_RUNNING_ARGS = argparse.Namespace(
+    keep_running=True, keep_presenting=False, verbose=0
+)
+KEEP_RUNNING_VERBOSE_ARGS = argparse.Namespace(
+    keep_running=True, keep_presenting=False, verbose=1
+)
+DEFAULT_ARGS = argparse.Namespace(keep_running=False, keep_presenting=False, verbose=0)
+
+# Expected output of the "wakepy methods" command with the probe_result fixture
+SEPARATOR = "━" * 55
+EXPECTED_METHODS_OUTPUT_LINES = [
+    SEPARATOR,
+    "                      keep.running",
+    SEPARATOR,
+    "  1. method-a                                 SUCCESS",
+    "  2. method-b                                 FAIL",
+    SEPARATOR,
+    "",
+]
+WIDE_SEPARATOR = "━" * 80
+EXPECTED_METHODS_OUTPUT_VERBOSE = f"""
+{WIDE_SEPARATOR}
+                                  keep.running
+{WIDE_SEPARATOR}
+
+  1. method-a
+     SUCCESS
+
+  2. method-b
+     FAIL: Missing requirement
+
+{WIDE_SEPARATOR}
+
+""".lstrip("\n")
+
+
+class WorkingMethod(Method):
+    """This is a successful method as it implements enter_mode which
+    returns None"""
+
+    name = "method1"
+    mode_name = "testmode_working"
+    supported_platforms = (PlatformType.ANY,)
+
+    def enter_mode(self) -> None:
+        return
+
+
+class BrokenMethod(Method):
+    """This is a unsuccessful method as it implements enter_mode which
+    raises an Exception"""
+
+    name = "method2_broken"
+    mode_name = "testmode_broken"
+    supported_platforms = (PlatformType.ANY,)
+
+    def enter_mode(self) -> None:
+        raise RuntimeError("foo")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def disable_logging():
+    """None of the CLI tests check log records, so logging is disabled while
+    running them. setup_logging() is tested with a replaced basicConfig, so
+    it is not affected by this. The previous disable level is restored
+    afterwards."""
+    previous_level = logging.root.manager.disable
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(previous_level)
 
 
 @pytest.fixture(scope="session")
-def mode_name_broken():
-    return "testmode_broken"
+def method_working():
+    return WorkingMethod
 
 
 @pytest.fixture(scope="session")
-def method_working(mode_name_working):
-    class WorkingMethod(Method):
-        """This is a successful method as it implements enter_mode which
-        returns None"""
+def method2_broken():
+    return BrokenMethod
 
-        name = "method1"
-        mode_name = mode_name_working
-        supported_platforms = (PlatformType.ANY,)
 
-        def enter_mode(self) -> None:
-            return
+@pytest.fixture(scope="module")
+def cli_app():
+    """A CliApp shared by the tests, as running it does not change its
+    state."""
+    return CliApp()
 
-    return WorkingMethod
 
+@pytest.fixture(scope="class")
+def no_setup_logging():
+    """Makes setup_logging do nothing, for all the tests in a class."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(wakepy_main, "setup_logging", lambda verbosity, command: None)
+        yield
 
-@pytest.fixture
-def method2_broken(mode_name_broken):
-    class BrokenMethod(Method):
-        """This is a unsuccessful method as it implements enter_mode which
-        raises an Exception"""
 
-        name = "method2_broken"
-        mode_name = mode_name_broken
-        supported_platforms = (PlatformType.ANY,)
+@pytest.fixture(scope="class")
+def no_wait_for_interrupt():
+    """Makes UI.wait_for_interrupt return immediately, for all the tests in a
+    class."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(UI, "wait_for_interrupt", lambda self, interval: None)
+        yield
 
-        def enter_mode(self) -> None:
-            raise RuntimeError("foo")
 
-    return BrokenMethod
+@pytest.fixture(
+    scope="module",
+    params=[
+        ("-r",),
+        ("--keep-running",),
+    ],
+    ids=["-r", "--keep-running"],
+)
+def keep_running_args(request):
+    return parse_args_cached(*request.param)
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        ("-p",),
+        ("--keep-presenting",),
+        # No args means keep presenting (default)
+        (),
+    ],
+    ids=["-p", "--keep-presenting", "no-args"],
+)
+def keep_presenting_args(request):
+    return parse_args_cached(*request.param)
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        ("-r", "-p"),
+        ("--keep-presenting", "-r"),
+        ("-p", "--keep-running"),
+        ("--keep-presenting", "--keep-running"),
+    ],
+    ids=[
+        "-r -p",
+        "--keep-presenting -r",
+        "-p --keep-running",
+        "--keep-presenting --keep-running",
+    ],
+)
+def too_many_modes_args(request):
+    return parse_args_cached(*request.param)
 
 
 class TestGetModeName:
-    @pytest.mark.parametrize(
-        "sysargs",
-        [
-            ["-r"],
-            ["--keep-running"],
-        ],
-    )
-    def test_keep_running(self, sysargs):
-        assert get_mode_name(parse_args(sysargs)) == ModeName.KEEP_RUNNING
+    def test_keep_running(self, keep_running_args):
+        assert get_mode_name(keep_running_args) == ModeName.KEEP_RUNNING
 
-    @pytest.mark.parametrize(
-        "sysargs",
-        [
-            ["-p"],
-            ["--keep-presenting"],
-            # No args means keep presenting (default)
-            [],
-        ],
-    )
-    def test_keep_presenting(self, sysargs):
-        assert get_mode_name(parse_args(sysargs)) == ModeName.KEEP_PRESENTING
+    def test_keep_presenting(self, keep_presenting_args):
+        assert get_mode_name(keep_presenting_args) == ModeName.KEEP_PRESENTING
 
-    @pytest.mark.parametrize(
-        "sysargs",
-        [
-            ["-r", "-p"],
-            ["--keep-presenting", "-r"],
-            ["-p", "--keep-running"],
-            ["--keep-presenting", "--keep-running"],
-        ],
-    )
-    def test_too_many_modes(self, sysargs):
+    def test_too_many_modes(self, too_many_modes_args):
         with pytest.raises(MultipleModesSelectedError):
-            get_mode_name(parse_args(sysargs))
+            get_mode_name(too_many_modes_args)
 
 
-def test_wait_for_interrupt_handles_keyboard_interrupt(capsys):
+def test_parser_is_created_once():
+    assert _create_parser() is _create_parser()
+
+
+def test_wait_for_interrupt_handles_keyboard_interrupt(capsys, monkeypatch):
     """Test that UI.wait_for_interrupt handles KeyboardInterrupt gracefully."""
     ui = UI()
 
@@ -113,181 +228,143 @@ def test_wait_for_interrupt_handles_keyboard_interrupt(capsys):
         yield "x"
         raise KeyboardInterrupt
 
-    with patch.object(ui, "spinner_frames", return_value=interrupting_frames()):
-        ui.wait_for_interrupt(interval=0)
+    monkeypatch.setattr(ui, "spinner_frames", interrupting_frames)
+    ui.wait_for_interrupt(interval=0)
 
     captured = capsys.readouterr().out
     assert captured == "x"
 
 
-def test_wait_for_interrupt_with_no_frames():
+def test_wait_for_interrupt_with_no_frames(monkeypatch):
     ui = UI()
-    with patch.object(ui, "spinner_frames", return_value=iter(())):
-        ui.wait_for_interrupt(interval=0)
+    monkeypatch.setattr(ui, "spinner_frames", lambda: iter(()))
+    ui.wait_for_interrupt(interval=0)
 
 
+@pytest.mark.usefixtures("no_wait_for_interrupt")
 class TestCliAppRunWakepy:
     """Tests the CliApp.run_wakepy() method from the __main__.py in a simple
     way. This is more of a smoke test. The functionality of the different parts
     is already tested in other unit tests."""
 
-    def test_working_mode(self, method_working):
-        with patch(
-            "wakepy.__main__.get_mode_name", return_value=method_working.mode_name
-        ), patch.object(UI, "wait_for_interrupt"):
-            app = CliApp()
-            args = parse_args([])
-            mode = app.run_wakepy(args)
-            assert mode.result.success is True
+    def test_working_mode(self, method_working, monkeypatch, cli_app):
+        monkeypatch.setattr(
+            wakepy_main, "get_mode_name", lambda _: method_working.mode_name
+        )
+        args = parse_args_cached()
+        mode = cli_app.run_wakepy(args)
+        assert mode.result.success is True
 
-    def test_non_working_mode(self, method2_broken, monkeypatch, capsys):
+    def test_non_working_mode(self, method2_broken, monkeypatch, capsys, cli_app):
         monkeypatch.setenv("WAKEPY_FAKE_SUCCESS", "0")  # needed for a failure
+        monkeypatch.setattr(
+            wakepy_main, "get_mode_name", lambda _: method2_broken.mode_name
+        )
 
-        with patch(
-            "wakepy.__main__.get_mode_name", return_value=method2_broken.mode_name
-        ), patch.object(UI, "wait_for_interrupt"):
-            app = CliApp()
-            args = parse_args([])
-            mode = app.run_wakepy(args)
-            assert mode.result.success is False
+        args = parse_args_cached()
+        mode = cli_app.run_wakepy(args)
+        assert mode.result.success is False
 
-            # the method2_broken enter_mode raises this:
-            assert mode.result.query()[0].failure_reason == "RuntimeError('foo')"
-            assert "Wakepy could not activate" in capsys.readouterr().out
+        # the method2_broken enter_mode raises this:
+        assert mode.result.query()[0].failure_reason == "RuntimeError('foo')"
+        assert "Wakepy could not activate" in capsys.readouterr().out
 
 
+@pytest.mark.usefixtures("no_wait_for_interrupt")
 class TestCliAppRunWakepyVerbose:
     """Tests for verbose output in run_wakepy()."""
 
     @pytest.mark.usefixtures("WAKEPY_FAKE_SUCCESS_eq_1")
-    def test_verbose_mode_with_methods(self, capsys, method_working: Method):
+    def test_verbose_mode_with_methods(
+        self, capsys, method_working: Method, monkeypatch, cli_app
+    ):
         """Test verbose mode when methods text is available."""
-        with patch(
-            "wakepy.__main__.get_mode_name", return_value=method_working.mode_name
-        ), patch.object(UI, "wait_for_interrupt"):
-            app = CliApp()
-            args = parse_args(["-v"])
-            mode = app.run_wakepy(args)
-            assert mode.result.success is True
-
-            output = capsys.readouterr().out
-            assert "Wakepy Methods (in the order of attempt):" in output
-
-    def test_verbose_mode_with_no_methods(self, capsys):
-        """Test verbose mode when methods text is empty."""
-        with patch("wakepy.__main__.get_mode_name", return_value="asdas"), patch.object(
-            UI, "wait_for_interrupt"
-        ):
-            app = CliApp()
-            args = parse_args(["-v"])
-            mode = app.run_wakepy(args)
-            assert mode.result.success is False
-
-            output = capsys.readouterr().out
-            assert "Did not try any methods!" in output
-
-
-class TestCliAppRunWakepyMethods:
-    @pytest.fixture
-    def probe_result(self):
-        return ProbingResults(
-            [
-                MethodActivationResult(
-                    method=get_method_info("method-a"),
-                    success=True,
-                ),
-                MethodActivationResult(
-                    method=get_method_info("method-b"),
-                    success=False,
-                    failure_stage=StageName.REQUIREMENTS,
-                    failure_reason="Missing requirement",
-                ),
-            ]
+        monkeypatch.setattr(
+            wakepy_main, "get_mode_name", lambda _: method_working.mode_name
         )
+        args = parse_args_cached("-v")
+        mode = cli_app.run_wakepy(args)
+        assert mode.result.success is True
 
-    def test_non_verbose_output(self, probe_result: ProbingResults, capsys):
-        args = argparse.Namespace(
-            keep_running=True,
-            keep_presenting=False,
-            verbose=0,
-        )
+        output = capsys.readouterr().out
+        assert "Wakepy Methods (in the order of attempt):" in output
 
-        app = CliApp()
-        app.run_wakepy_methods(args, probe_runner=lambda _: probe_result)
+    def test_verbose_mode_with_no_methods(self, capsys, monkeypatch, cli_app):
+        """Test verbose mode when methods text is empty."""
+        monkeypatch.setattr(wakepy_main, "get_mode_name", lambda _: "asdas")
+        args = parse_args_cached("-v")
+        mode = cli_app.run_wakepy(args)
+        assert mode.result.success is False
 
         output = capsys.readouterr().out
-        # Compare normalized output (strip trailing spaces per line)
-        expected_lines = [
-            "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━",
-            "                      keep.running",
-            "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━",
-            "  1. method-a                                 SUCCESS",
-            "  2. method-b                                 FAIL",
-            "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━",
-            "",
-        ]
-        output_lines = [line.rstrip() for line in output.splitlines()]
-        assert expected_lines == output_lines
+        assert "Did not try any methods!" in output
 
-    def test_verbose_output(self, probe_result: ProbingResults, capsys):
-        args = argparse.Namespace(
-            keep_running=True,
-            keep_presenting=False,
-            verbose=1,
-        )
 
-        app = CliApp()
-        app.run_wakepy_methods(args, probe_runner=lambda _: probe_result)
+@pytest.fixture(scope="module")
+def probe_result():
+    return ProbingResults(
+        [
+            MethodActivationResult(
+                method=get_method_info("method-a"),
+                success=True,
+            ),
+            MethodActivationResult(
+                method=get_method_info("method-b"),
+                success=False,
+                failure_stage=StageName.REQUIREMENTS,
+                failure_reason="Missing requirement",
+            ),
+        ]
+    )
 
-        output = capsys.readouterr().out
-        expected = """
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-                                  keep.running
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-  1. method-a
-     SUCCESS
+@pytest.fixture(scope="module")
+def empty_activation_result():
+    return ActivationResult([])
 
-  2. method-b
-     FAIL: Missing requirement
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class TestCliAppRunWakepyMethods:
+    def test_non_verbose_output(self, probe_result: ProbingResults, cli_app):
+        with redirect_stdout(StringIO()) as stdout:
+            cli_app.run_wakepy_methods(
+                KEEP_RUNNING_ARGS, probe_runner=lambda _: probe_result
+            )
 
-""".lstrip("\n")
-        assert expected == output
+        output = stdout.getvalue()
+        # Compare normalized output (strip trailing spaces per line)
+        output_lines = [line.rstrip() for line in output.splitlines()]
+        assert EXPECTED_METHODS_OUTPUT_LINES == output_lines
 
-    def test_default_probe_runner_prints_output(self, probe_result, capsys):
-        args = argparse.Namespace(
-            keep_running=False,
-            keep_presenting=False,
-            verbose=0,
-        )
+    def test_verbose_output(self, probe_result: ProbingResults, cli_app):
+        with redirect_stdout(StringIO()) as stdout:
+            cli_app.run_wakepy_methods(
+                KEEP_RUNNING_VERBOSE_ARGS, probe_runner=lambda _: probe_result
+            )
 
-        with patch(
-            "wakepy.__main__.Mode.probe_all_methods",
-            return_value=probe_result,
-        ):
-            app = CliApp()
-            app.run_wakepy_methods(args)
+        output = stdout.getvalue()
+        assert EXPECTED_METHODS_OUTPUT_VERBOSE == output
 
-        assert capsys.readouterr().out
+    def test_default_probe_runner_prints_output(
+        self, probe_result, cli_app, monkeypatch
+    ):
+        monkeypatch.setattr(Mode, "probe_all_methods", lambda self: probe_result)
+        with redirect_stdout(StringIO()) as stdout:
+            cli_app.run_wakepy_methods(DEFAULT_ARGS)
 
-    def test_probe_runner_overrides_default(self, probe_result, capsys):
-        args = argparse.Namespace(
-            keep_running=False,
-            keep_presenting=False,
-            verbose=0,
-        )
+        assert stdout.tell() > 0
 
-        app = CliApp()
-        app.run_wakepy_methods(args, probe_runner=lambda _: probe_result)
+    def test_probe_runner_overrides_default(self, probe_result, cli_app):
+        with redirect_stdout(StringIO()) as stdout:
+            cli_app.run_wakepy_methods(
+                DEFAULT_ARGS, probe_runner=lambda _: probe_result
+            )
 
-        assert capsys.readouterr().out
+        assert stdout.tell() > 0
 
 
 class TestDisplayTheme:
     def test_create_unicode(self):
-        theme = DisplayTheme.create(ascii_mode=False)
+        theme = UNICODE_THEME
         # fmt: off
         assert theme.spinner_symbols == ("⢎⡰", "⢎⡡", "⢎⡑", "⢎⠱", "⠎⡱", "⢊⡱", "⢌⡱", "⢆⡱")  # noqa: E501
         # fmt: on
@@ -295,40 +372,27 @@ class TestDisplayTheme:
         assert theme.ascii_mode is False
 
     def test_create_ascii(self):
-        theme = DisplayTheme.create(ascii_mode=True)
+        theme = ASCII_THEME
         assert theme.spinner_symbols == ("|", "/", "-", "\\")
         assert theme.success_symbol == "x"
         assert theme.ascii_mode is True
 
 
 class TestShouldUseAsciiOnly:
-    @pytest.mark.parametrize(
-        "platform,python_impl,expected",
-        [
-            # Non-Windows platforms should always use Unicode
-            (IdentifiedPlatformType.LINUX, "CPython", False),
-            (IdentifiedPlatformType.LINUX, "PyPy", False),
-            (IdentifiedPlatformType.MACOS, "CPython", False),
-            (IdentifiedPlatformType.MACOS, "PyPy", False),
-            # Windows + PyPy needs ASCII mode
-            (IdentifiedPlatformType.WINDOWS, "PyPy", True),
-            (IdentifiedPlatformType.WINDOWS, "pypy", True),  # case insensitive
-            # Windows + CPython can use Unicode
-            (IdentifiedPlatformType.WINDOWS, "CPython", False),
-        ],
-    )
-    def test_ascii_mode_detection(self, platform, python_impl, expected):
+    def test_ascii_mode_detection(self):
         """Test ASCII mode detection based on platform and Python impl."""
-        assert (
-            get_should_use_ascii_only(
-                current_platform=platform, python_impl=python_impl
-            )
-            is expected
-        )
-
-
-class TestRendering:
-    expected_logo = r"""
+        for platform, python_impl, expected in ASCII_MODE_CASES:
+            assert (
+                get_should_use_ascii_only(
+                    current_platform=platform, python_impl=python_impl
+                )
+                is expected
+            ), (platform, python_impl)
+
+
+@lru_cache(maxsize=None)
+def expected_logo() -> str:
+    return r"""
                          _
                         | |
         __      __ __ _ | | __ ___  _ __   _   _
@@ -338,45 +402,57 @@ class TestRendering:
          v.1.0.0                   | |      __/ |
                                    |_|     |___/ """.lstrip("\n")  # noqa: W291
 
-    expected_info_box_unicode = r"""
+
+@lru_cache(maxsize=None)
+def expected_info_box(success_symbol: str) -> str:
+    """The expected info box for test_mode and test_method; the themes differ
+    only by the success symbol."""
+    return r"""
  ┏━━ Mode: test_mode ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┓
  ┃                                                      ┃
- ┃  [✔] Programs keep running                           ┃
+ ┃  [{success_symbol}] Programs keep running                           ┃
  ┃  [ ] Display kept on, screenlock disabled            ┃
  ┃                                                      ┃
  ┃   Method: test_method                                ┃
- ┗━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┛""".lstrip("\n")  # noqa: W291
+ ┗━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┛""".lstrip("\n").format(  # noqa: W291
+        success_symbol=success_symbol
+    )
 
-    expected_info_box_ascii = r"""
- ┏━━ Mode: test_mode ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┓
+
+@lru_cache(maxsize=None)
+def expected_info_box_long_names() -> str:
+    return r"""
+ ┏━━ Mode: mode_abcdefghijklmnopqrstuvwxyzABCDEFGHIJKL ━┓
  ┃                                                      ┃
- ┃  [x] Programs keep running                           ┃
+ ┃  [✔] Programs keep running                           ┃
  ┃  [ ] Display kept on, screenlock disabled            ┃
  ┃                                                      ┃
- ┃   Method: test_method                                ┃
+ ┃   Method: method_abcdefghijklmnopqrstuvwxyzABCDEFGHI ┃
  ┗━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┛""".lstrip("\n")  # noqa: W291
 
+
+class TestRendering:
     def test_render_logo(self):
         ui = UI()
         output_logo = ui.render_logo("1.0.0")
-        assert output_logo == self.expected_logo
+        assert output_logo == expected_logo()
 
     @pytest.mark.parametrize(
-        "ascii_mode,expected_info_box",
+        "theme,success_symbol",
         [
-            (False, expected_info_box_unicode),  # Unicode
-            (True, expected_info_box_ascii),  # ASCII
+            (UNICODE_THEME, "✔"),
+            (ASCII_THEME, "x"),
         ],
+        ids=["unicode", "ascii"],
     )
-    def test_render_info_box_uses_correct_template(self, ascii_mode, expected_info_box):
-        theme = DisplayTheme.create(ascii_mode=ascii_mode)
+    def test_render_info_box_uses_correct_template(self, theme, success_symbol):
         ui = UI(theme=theme)
         output_box = ui.render_info_box(
             "test_mode",
             "test_method",
             is_presentation_mode=False,
         )
-        assert output_box == expected_info_box
+        assert output_box == expected_info_box(success_symbol)
 
     def test_render_fake_success_warning(self):
         ui = UI()
@@ -386,91 +462,90 @@ class TestRendering:
         assert "WARNING" in formatted
 
     def test_render_info_box_truncates_long_names(self):
-        base = string.ascii_letters + string.digits
-        very_long_mode = "mode_" + base
-        very_long_method = "method_" + base
-        theme = DisplayTheme.create(ascii_mode=False)
-        ui = UI(theme=theme)
+        ui = UI(theme=UNICODE_THEME)
         formatted = ui.render_info_box(
-            very_long_mode,
-            very_long_method,
+            VERY_LONG_MODE_NAME,
+            VERY_LONG_METHOD_NAME,
             is_presentation_mode=False,
         )
 
-        expected = r"""
- ┏━━ Mode: mode_abcdefghijklmnopqrstuvwxyzABCDEFGHIJKL ━┓
- ┃                                                      ┃
- ┃  [✔] Programs keep running                           ┃
- ┃  [ ] Display kept on, screenlock disabled            ┃
- ┃                                                      ┃
- ┃   Method: method_abcdefghijklmnopqrstuvwxyzABCDEFGHI ┃
- ┗━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┛""".lstrip("\n")  # noqa: W291
-        assert formatted == expected
+        assert formatted == expected_info_box_long_names()
 
     def test_spinner_frames(self):
-        theme = DisplayTheme.create(ascii_mode=False)
+        theme = UNICODE_THEME
         ui = UI(theme=theme)
 
-        # Get the first few frames from the infinite generator
-        frames = []
-        for i, frame in enumerate(ui.spinner_frames()):
-            frames.append(frame)
-            if i >= len(theme.spinner_symbols):
-                # Get one full cycle plus one to verify it cycles
-                break
+        # Get one full cycle plus one from the infinite generator, to verify
+        # that it cycles
+        frames = list(islice(ui.spinner_frames(), len(theme.spinner_symbols) + 1))
 
         # Check that we got frames
         assert len(frames) > 0
 
         # Each frame should contain the "Press Ctrl+C to exit" message
-        for frame in frames:
-            assert "[Press Ctrl+C to exit]" in frame
+        assert all("[Press Ctrl+C to exit]" in frame for frame in frames)
 
         # The frames should cycle through the symbols
         # First frame should contain first symbol, etc.
-        for i, symbol in enumerate(theme.spinner_symbols):
-            assert symbol in frames[i]
+        assert all(
+            symbol in frame for symbol, frame in zip(theme.spinner_symbols, frames)
+        ), frames
+        # ..and start from the first symbol again after a full cycle
+        assert theme.spinner_symbols[0] in frames[-1]
 
-    def test_render_activation_error_default_system_info(self):
+    def test_render_activation_error_default_system_info(self, empty_activation_result):
         ui = UI()
-        result = ActivationResult([])
-        formatted = ui.render_activation_error(result)
+        formatted = ui.render_activation_error(empty_activation_result)
         assert "Wakepy could not activate" in formatted
 
 
+class CallCountingCliApp(CliApp):
+    """A CliApp which only counts how many times its run methods are called."""
+
+    def __init__(self) -> None:
+        self.run_wakepy_calls = 0
+        self.run_wakepy_methods_calls = 0
+
+    def run_wakepy(self, args):
+        self.run_wakepy_calls += 1
+
+    def run_wakepy_methods(self, args, probe_runner=None):
+        self.run_wakepy_methods_calls += 1
+
+
+@pytest.mark.usefixtures("no_setup_logging")
 class TestMain:
     """Test the main() entry point function."""
 
-    def test_main_calls_run_wakepy(self):
-        """Test that main() parses args and calls run_wakepy."""
-        mock_app = Mock()
-        with patch("wakepy.__main__.setup_logging"):
-            main(argv=["-v", "-p"], app=mock_app)
-        mock_app.run_wakepy.assert_called_once()
-        mock_app.run_wakepy_methods.assert_not_called()
-
-    def test_main_default_app_and_argv(self):
-        with patch("wakepy.__main__.setup_logging"), patch(
-            "wakepy.__main__.CliApp"
-        ) as mock_cli_app, patch("wakepy.__main__.sys.argv", ["wakepy", "-v", "-p"]):
-            main()
-            mock_instance = mock_cli_app.return_value
-            mock_instance.run_wakepy.assert_called_once()
-            mock_instance.run_wakepy_methods.assert_not_called()
-
-    def test_main_calls_run_wakepy_methods(self):
-        """Test that main() calls run_wakepy_methods for 'methods' command."""
-        mock_app = Mock()
-        with patch("wakepy.__main__.setup_logging"):
-            main(argv=["methods", "-p"], app=mock_app)
-        mock_app.run_wakepy_methods.assert_called_once()
-        mock_app.run_wakepy.assert_not_called()
+    @pytest.mark.parametrize(
+        "argv, expected_run_wakepy_calls, expected_run_wakepy_methods_calls",
+        [
+            (["-v", "-p"], 1, 0),
+            (["methods", "-p"], 0, 1),
+        ],
+        ids=["run", "methods"],
+    )
+    def test_main_dispatches(
+        self, argv, expected_run_wakepy_calls, expected_run_wakepy_methods_calls
+    ):
+        """Test that main() parses args and calls run_wakepy, or
+        run_wakepy_methods for the 'methods' command."""
+        app = CallCountingCliApp()
+        main(argv=argv, app=app)
+        assert app.run_wakepy_calls == expected_run_wakepy_calls
+        assert app.run_wakepy_methods_calls == expected_run_wakepy_methods_calls
+
+    def test_main_default_app_and_argv(self, monkeypatch):
+        app = CallCountingCliApp()
+        monkeypatch.setattr(wakepy_main, "CliApp", lambda: app)
+        monkeypatch.setattr(sys, "argv", ["wakepy", "-v", "-p"])
+        main()
+        assert app.run_wakepy_calls == 1
+        assert app.run_wakepy_methods_calls == 0
 
     def test_main_handles_multiple_modes_error(self, capsys):
         """Test that main() catches MultipleModesSelectedError and exits."""
-        with patch("wakepy.__main__.setup_logging"), pytest.raises(
-            SystemExit
-        ) as exc_info:
+        with pytest.raises(SystemExit) as exc_info:
             main(argv=["-r", "-p"])
         assert exc_info.value.code == 2
         captured = capsys.readouterr()
@@ -479,31 +554,26 @@ class TestMain:
 
 class TestGetLoggingLevel:
     @pytest.mark.parametrize(
-        "verbosity, expected_level",
+        "command, expected_levels",
         [
-            (0, logging.WARNING),
-            (1, logging.INFO),
-            (2, logging.DEBUG),
-            (3, logging.DEBUG),
+            (None, [logging.WARNING, logging.INFO, logging.DEBUG, logging.DEBUG]),
+            # For methods, -v only enables detailed output, not INFO
+            (
+                "methods",
+                [logging.WARNING, logging.WARNING, logging.INFO, logging.DEBUG],
+            ),
         ],
+        ids=["run", "methods"],
     )
-    def test_get_logging_level(self, verbosity, expected_level):
-        assert get_logging_level(verbosity) == expected_level
-
-    @pytest.mark.parametrize(
-        "verbosity, expected_level",
-        [
-            (0, logging.WARNING),
-            (1, logging.WARNING),  # -v only enables detailed output, not INFO
-            (2, logging.INFO),
-            (3, logging.DEBUG),
-        ],
-    )
-    def test_get_logging_level_methods(self, verbosity, expected_level):
-        assert get_logging_level(verbosity, command="methods") == expected_level
-
-
-def test_setup_logging_calls_basic_config():
-    with patch("wakepy.__main__.logging.basicConfig") as basic_config:
-        setup_logging(verbosity=1, command="run")
-        basic_config.assert_called_once()
+    def test_get_logging_level(self, command, expected_levels):
+        """The expected_levels are for verbosity 0, 1, 2 and 3."""
+        levels = [get_logging_level(verbosity, command) for verbosity in range(4)]
+        assert levels == expected_levels
+
+
+def test_setup_logging_calls_basic_config(monkeypatch):
+    calls = []
+    monkeypatch.setattr(logging, "basicConfig", lambda **kwargs: calls.append(kwargs))
+    setup_logging(verbosity=1, command="run")
+    assert len(calls) == 1
+    assert calls[0]["level"] == logging.INFO
@@ -0,0 +1,26 @@
+"""This module tests that the Methods which use D-Bus opt in to getting the
+DBusAdapter of the Mode with Method.uses_dbus."""
+
+import pytest
+
+from wakepy.core import ModeName
+from wakepy.core.registry import get_methods_for_mode
+from wakepy.methods import freedesktop, gnome
+
+dbus_method_modules = {freedesktop.__name__, gnome.__name__}
+
+dbus_methods = [
+    method_cls
+    for mode_name in ModeName
+    for method_cls in get_methods_for_mode(mode_name)
+    if method_cls.__module__ in dbus_method_modules
+]
+
+
+def test_dbus_methods_are_found():
+    assert len(dbus_methods) == 4
+
+
+@pytest.mark.parametrize("method_cls", dbus_methods, ids=lambda m: m.name)
+def test_uses_dbus(method_cls):
+    assert method_cls.uses_dbus is True
@@ -33,3 +33,16 @@ def test_exit_before_enter(caplog):
     # Assert
     assert caplog.text.startswith("DEBUG ")
     assert "No need to terminate process (not started)" in caplog.text
+
+
+def test_command_is_logged(caplog):
+    method = DummyMacCaffeinate()
+
+    # Act
+    with caplog.at_level(logging.DEBUG):
+        method.enter_mode()
+        method.exit_mode()
+
+    # Assert
+    assert 'Running "ls"' in caplog.text
+    assert 'Terminating process ("ls")' in caplog.text